@@ -11,87 +11,226 @@ Constitutional Alignment:
 - Article V: Zero-Trust Security - Validates security metadata
 
 Usage:
-    ./validate-manifest-schema.py <manifest-file>
+    ./validate-manifest-schema.py <manifest-file> [<manifest-file> ...]
     ./validate-manifest-schema.py releases/release-v1.0.0.yaml
+    ./validate-manifest-schema.py releases/*.yaml
 """
 
-import argparse
+import contextlib
+import functools
+import io
 import json
+import os
+import pickle
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
-
-try:
-    import jsonschema
-    from jsonschema import validate, ValidationError, SchemaError
-except ImportError:
-    print("❌ Error: jsonschema package not installed")
-    print("Install with: pip install jsonschema")
-    sys.exit(1)
-
-try:
-    import yaml
-except ImportError:
-    print("❌ Error: PyYAML package not installed")
-    print("Install with: pip install PyYAML")
-    sys.exit(1)
-
-
-class Colors:
-    """ANSI color codes for terminal output."""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+# Semver pattern used by additional_validations, compiled once per run.
+# It is applied with fullmatch(), so no anchors are needed.
+_SEMVER_RE = re.compile(r'v[0-9]+\.[0-9]+\.[0-9]+(?:-[a-z0-9]+)?')
+
+# Commit SHAs and image digests are fixed-length lowercase hex, checked
+# with bytes.translate() instead of the regex engine
+_HEX_DIGITS = b'0123456789abcdef'
+_SHA_LENGTH = 40
+_DIGEST_PREFIX = 'sha256:'
+_DIGEST_LENGTH = len(_DIGEST_PREFIX) + 64
+
+# ANSI color codes for terminal output; left empty when stdout is not a
+# TTY so CI logs stay free of escape sequences
+_TTY = sys.stdout.isatty()
+GREEN = '\033[92m' if _TTY else ''
+RED = '\033[91m' if _TTY else ''
+YELLOW = '\033[93m' if _TTY else ''
+BLUE = '\033[94m' if _TTY else ''
+RESET = '\033[0m' if _TTY else ''
+BOLD = '\033[1m' if _TTY else ''
+
+DEFAULT_SCHEMA = Path(__file__).parent.parent / 'schemas' / 'release-manifest-schema.json'
+
+
+# PyYAML and jsonschema are imported on first use rather than at module
+# load, so --help and usage errors do not pay for them.
+@functools.lru_cache(maxsize=None)
+def _yaml() -> Any:
+    """
+    Import PyYAML and pick its loader and dumper.
+    
+    Returns:
+        (yaml module, safe loader, safe dumper), preferring the
+        libyaml-backed C classes when PyYAML was built with them
+    """
+    try:
+        import yaml
+    except ImportError:
+        print("❌ Error: PyYAML package not installed")
+        print("Install with: pip install PyYAML")
+        sys.exit(1)
+    return (
+        yaml,
+        getattr(yaml, 'CSafeLoader', yaml.SafeLoader),
+        getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _jsonschema() -> Any:
+    """Import jsonschema."""
+    try:
+        import jsonschema
+    except ImportError:
+        print("❌ Error: jsonschema package not installed")
+        print("Install with: pip install jsonschema")
+        sys.exit(1)
+    return jsonschema
+
+
+def _schema_cache_path(schema_path: Path) -> Path:
+    """
+    Return the pickle cache location for a schema file.
+    
+    There is one cache file per schema path, overwritten whenever the
+    schema changes. The directory is worked out here rather than at import
+    so that a missing home directory only disables the cache.
+    """
+    import zlib
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    name = zlib.crc32(str(schema_path.resolve()).encode())
+    return Path(cache_home) / 'rh1-release-manifest' / f"manifest-schema-{name:08x}.pkl"
+
+
+def _schema_cache_key(schema_path: Path) -> Tuple[str, int, int]:
+    """Return the (path, mtime, size) key a cached schema must match."""
+    stat = schema_path.stat()
+    return str(schema_path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+def _write_schema_cache(cache_path: Path, entry: Tuple[Any, Dict[str, Any]]) -> None:
+    """Pickle a (key, schema) entry to the cache; failures only cost a re-parse."""
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
 
 def load_schema(schema_path: Path) -> Dict[str, Any]:
-    """Load JSON schema from file."""
+    """Load JSON schema from file, reusing the pickled copy when up to date."""
+    cache_path = cache_key = None
+    try:
+        cache_path = _schema_cache_path(schema_path)
+        cache_key = _schema_cache_key(schema_path)
+        with open(cache_path, 'rb') as f:
+            key, schema = pickle.load(f)
+        if key == cache_key:
+            return schema
+    except Exception:
+        # No usable cache entry (or no cache directory); re-parse and
+        # rewrite it. A missing schema file is reported below.
+        pass
+    
+    # orjson is optional and only needed on a cache miss; it parses the
+    # schema considerably faster than json
     try:
-        with open(schema_path, 'r') as f:
-            return json.load(f)
+        from orjson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
+    
+    try:
+        with open(schema_path, 'rb') as f:
+            schema = json_loads(f.read())
     except FileNotFoundError:
-        print(f"{Colors.RED}❌ Schema file not found: {schema_path}{Colors.RESET}")
+        print(f"{RED}❌ Schema file not found: {schema_path}{RESET}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"{Colors.RED}❌ Invalid JSON schema: {e}{Colors.RESET}")
+    except json.JSONDecodeError as e:  # also raised as orjson.JSONDecodeError
+        print(f"{RED}❌ Invalid JSON schema: {e}{RESET}")
         sys.exit(1)
+    
+    if cache_key is not None:
+        _write_schema_cache(cache_path, (cache_key, schema))
+    return schema
+
+
+@functools.lru_cache(maxsize=8)
+def _build_validator(schema_path: Path, mtime_ns: int) -> Any:
+    """
+    Load a schema, check it once and build its validator.
+    
+    The mtime_ns argument is not used directly; it is part of the cache
+    key so that editing the schema file invalidates the cached validator.
+    
+    Returns:
+        A jsonschema validator instance for the schema
+    """
+    jsonschema = _jsonschema()
+    schema = load_schema(schema_path)
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    # No format checker: additional_validations re-checks the formats we
+    # care about (semver, commit SHA, image digest)
+    return cls(schema)
+
+
+def _schema_key(schema_path: Path) -> Tuple[Path, int]:
+    """Return the (resolved path, mtime) cache key for a schema file."""
+    try:
+        mtime_ns = schema_path.stat().st_mtime_ns
+    except OSError:
+        # Let load_schema report the missing file
+        mtime_ns = 0
+    return schema_path.resolve(), mtime_ns
+
+
+def get_validator(schema_path: Path) -> Any:
+    """Return a cached JSON schema validator for the given schema file."""
+    return _build_validator(*_schema_key(schema_path))
 
 
 def load_manifest(manifest_path: Path) -> Dict[str, Any]:
     """Load YAML manifest from file."""
+    yaml, loader, _ = _yaml()
     try:
-        with open(manifest_path, 'r') as f:
-            return yaml.safe_load(f)
+        # Hand the binary stream to the parser; libyaml does its own
+        # decoding, and errors still name the file
+        with open(manifest_path, 'rb') as f:
+            return yaml.load(f, Loader=loader)
     except FileNotFoundError:
-        print(f"{Colors.RED}❌ Manifest file not found: {manifest_path}{Colors.RESET}")
+        print(f"{RED}❌ Manifest file not found: {manifest_path}{RESET}")
         sys.exit(1)
     except yaml.YAMLError as e:
-        print(f"{Colors.RED}❌ Invalid YAML manifest: {e}{Colors.RESET}")
+        print(f"{RED}❌ Invalid YAML manifest: {e}{RESET}")
         sys.exit(1)
 
 
+def _is_lower_hex(value: str) -> bool:
+    """Return True if value consists only of lowercase hex digits."""
+    # Deleting every hex digit leaves nothing behind for a valid value
+    return value.isascii() and not value.encode('ascii').translate(None, _HEX_DIGITS)
+
+
 def validate_semantic_version(version: str) -> bool:
     """Validate semantic version format."""
-    import re
-    pattern = r'^v\d+\.\d+\.\d+(-[a-z0-9]+)?$'
-    return bool(re.match(pattern, version))
+    return _SEMVER_RE.fullmatch(version) is not None
 
 
 def validate_commit_sha(sha: str) -> bool:
     """Validate Git commit SHA format."""
-    import re
-    pattern = r'^[a-f0-9]{40}$'
-    return bool(re.match(pattern, sha))
+    return len(sha) == _SHA_LENGTH and _is_lower_hex(sha)
 
 
 def validate_image_digest(digest: str) -> bool:
     """Validate container image digest format."""
-    import re
-    pattern = r'^sha256:[a-f0-9]{64}$'
-    return bool(re.match(pattern, digest))
+    return (
+        len(digest) == _DIGEST_LENGTH
+        and digest.startswith(_DIGEST_PREFIX)
+        and _is_lower_hex(digest[len(_DIGEST_PREFIX):])
+    )
 
 
 def additional_validations(manifest: Dict[str, Any]) -> List[str]:
@@ -104,61 +243,63 @@ def additional_validations(manifest: Dict[str, Any]) -> List[str]:
     - Checks approval requirements
     """
     warnings = []
+    add_warning = warnings.append
     
-    # Check environment-specific requirements
-    environment = manifest.get('metadata', {}).get('environment', '')
+    # Bind the manifest sections once; everything below reads from these
+    spec = manifest.get('spec') or {}
+    components = spec.get('components') or ()
+    is_prod = (manifest.get('metadata') or {}).get('environment') == 'prod'
     
     # Production-specific validations (Article IV: Production-Grade Quality)
-    if environment == 'prod':
-        spec = manifest.get('spec', {})
-        
+    if is_prod:
         # Check for security scan
         if 'securityScan' not in spec:
-            warnings.append("⚠️  Production release missing security scan results")
+            add_warning("⚠️  Production release missing security scan results")
         elif not spec['securityScan'].get('passed', False):
-            warnings.append("⚠️  Production release has failing security scan")
+            add_warning("⚠️  Production release has failing security scan")
         
         # Check for approvals (Article II: Separation of Duties)
         if 'approvals' not in spec or len(spec['approvals']) == 0:
-            warnings.append("⚠️  Production release missing approvals")
+            add_warning("⚠️  Production release missing approvals")
         
         # Check for test results
         if 'tests' not in spec:
-            warnings.append("⚠️  Production release missing test results")
+            add_warning("⚠️  Production release missing test results")
         elif not spec['tests'].get('passed', False):
-            warnings.append("⚠️  Production release has failing tests")
+            add_warning("⚠️  Production release has failing tests")
     
     # Validate component versions
-    for component in manifest.get('spec', {}).get('components', []):
-        version = component.get('version', '')
+    for component in components:
+        name = component.get('name')
+        version = component.get('version')
+        commit_sha = component.get('commitSha')
+        image_digest = component.get('imageDigest')
+        
         if version and not validate_semantic_version(version):
-            warnings.append(
-                f"⚠️  Component '{component.get('name')}' has invalid "
+            add_warning(
+                f"⚠️  Component '{name}' has invalid "
                 f"semantic version: {version}"
             )
         
         # Validate commit SHA if present
-        commit_sha = component.get('commitSha', '')
         if commit_sha and not validate_commit_sha(commit_sha):
-            warnings.append(
-                f"⚠️  Component '{component.get('name')}' has invalid "
+            add_warning(
+                f"⚠️  Component '{name}' has invalid "
                 f"commit SHA: {commit_sha}"
             )
         
         # Validate image digest if present (for EEs)
-        image_digest = component.get('imageDigest', '')
         if image_digest and not validate_image_digest(image_digest):
-            warnings.append(
-                f"⚠️  Component '{component.get('name')}' has invalid "
+            add_warning(
+                f"⚠️  Component '{name}' has invalid "
                 f"image digest: {image_digest}"
             )
     
     # Check for rollback target in production
-    if environment == 'prod':
-        if 'rollbackTarget' not in manifest.get('spec', {}):
-            warnings.append(
-                "⚠️  Production release should specify rollbackTarget"
-            )
+    if is_prod and 'rollbackTarget' not in spec:
+        add_warning(
+            "⚠️  Production release should specify rollbackTarget"
+        )
     
     return warnings
 
@@ -170,59 +311,120 @@ def validate_manifest_file(manifest_path: Path, schema_path: Path, verbose: bool
     Returns:
         True if validation passes, False otherwise
     """
-    print(f"\n{Colors.BLUE}{Colors.BOLD}🔍 Validating Release Manifest{Colors.RESET}")
+    print(f"\n{BLUE}{BOLD}🔍 Validating Release Manifest{RESET}")
     print(f"Manifest: {manifest_path}")
     print(f"Schema:   {schema_path}")
     print()
     
     # Load schema and manifest
-    schema = load_schema(schema_path)
+    jsonschema = _jsonschema()
+    try:
+        validator = get_validator(schema_path)
+    except jsonschema.SchemaError as e:
+        print(f"{RED}❌ Schema itself is invalid:{RESET}")
+        print(f"   {e.message}")
+        return False
+    
     manifest = load_manifest(manifest_path)
     
     if verbose:
-        print(f"{Colors.BLUE}Manifest content:{Colors.RESET}")
-        print(yaml.dump(manifest, default_flow_style=False))
+        print(f"{BLUE}Manifest content:{RESET}")
+        # Stream straight to stdout, keeping the manifest's own key order
+        yaml, _, dumper = _yaml()
+        yaml.dump(manifest, sys.stdout, Dumper=dumper,
+                  default_flow_style=False, sort_keys=False)
         print()
     
-    # Validate against JSON schema
-    try:
-        validate(instance=manifest, schema=schema)
-        print(f"{Colors.GREEN}✅ Schema validation passed{Colors.RESET}")
-    except ValidationError as e:
-        print(f"{Colors.RED}❌ Schema validation failed:{Colors.RESET}")
-        print(f"   {e.message}")
-        if e.path:
-            print(f"   Path: {' -> '.join(str(p) for p in e.path)}")
-        if verbose:
-            print(f"\n{Colors.YELLOW}Full error:{Colors.RESET}")
-            print(e)
-        return False
-    except SchemaError as e:
-        print(f"{Colors.RED}❌ Schema itself is invalid:{Colors.RESET}")
-        print(f"   {e.message}")
+    # Validate against JSON schema, collecting every error in one pass
+    errors = list(validator.iter_errors(manifest))
+    
+    if errors:
+        print(f"{RED}❌ Schema validation failed ({len(errors)} error(s)):{RESET}")
+        for error in errors:
+            print(f"   {error.message}")
+            if error.path:
+                print(f"   Path: {' -> '.join(str(p) for p in error.path)}")
+            if verbose:
+                print(f"\n{YELLOW}Full error:{RESET}")
+                print(error)
+                print()
         return False
+    print(f"{GREEN}✅ Schema validation passed{RESET}")
     
     # Perform additional validations
     warnings = additional_validations(manifest)
     if warnings:
-        print(f"\n{Colors.YELLOW}⚠️  Additional warnings:{Colors.RESET}")
+        print(f"\n{YELLOW}⚠️  Additional warnings:{RESET}")
         for warning in warnings:
             print(f"   {warning}")
     
     # Summary
-    print(f"\n{Colors.GREEN}{Colors.BOLD}✅ Validation complete!{Colors.RESET}")
-    print(f"Environment: {manifest.get('metadata', {}).get('environment', 'unknown')}")
-    print(f"Version:     {manifest.get('metadata', {}).get('version', 'unknown')}")
-    print(f"Components:  {len(manifest.get('spec', {}).get('components', []))}")
+    metadata = manifest.get('metadata') or {}
+    components = (manifest.get('spec') or {}).get('components') or ()
+    print(f"\n{GREEN}{BOLD}✅ Validation complete!{RESET}")
+    print(f"Environment: {metadata.get('environment', 'unknown')}")
+    print(f"Version:     {metadata.get('version', 'unknown')}")
+    print(f"Components:  {len(components)}")
     
     if warnings:
-        print(f"\n{Colors.YELLOW}Note: Warnings do not fail validation but should be reviewed.{Colors.RESET}")
+        print(f"\n{YELLOW}Note: Warnings do not fail validation but should be reviewed.{RESET}")
     
     return True
 
 
-def main():
-    """Main entry point."""
+def _validate_one(manifest_path: Path, schema_path: Path, verbose: bool) -> Tuple[Path, bool, str]:
+    """
+    Validate one manifest in a batch worker, capturing its report.
+    
+    Returns:
+        (manifest path, whether validation passed, report text)
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            success = validate_manifest_file(manifest_path, schema_path, verbose)
+        except SystemExit:
+            # load_schema/load_manifest exit on unreadable files
+            success = False
+    return manifest_path, success, output.getvalue()
+
+
+def validate_manifest_files(manifest_paths: List[Path], schema_path: Path, verbose: bool = False) -> bool:
+    """
+    Validate several manifests in parallel worker processes.
+    
+    Each worker keeps its own cached validator and reads the parsed schema
+    from the on-disk cache. Reports are printed in argument order.
+    
+    Returns:
+        True if every manifest passes, False otherwise
+    """
+    # Imported here so single-manifest runs do not pay for it
+    import multiprocessing
+    
+    processes = min(len(manifest_paths), os.cpu_count() or 1)
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.starmap(
+            _validate_one,
+            [(path, schema_path, verbose) for path in manifest_paths]
+        )
+    
+    for _, _, output in results:
+        sys.stdout.write(output)
+    
+    failed = [path for path, success, _ in results if not success]
+    color = RED if failed else GREEN
+    print(f"\n{color}{BOLD}Validated {len(results)} manifests: "
+          f"{len(results) - len(failed)} passed, {len(failed)} failed{RESET}")
+    for path in failed:
+        print(f"   ❌ {path}")
+    
+    return not failed
+
+
+def build_parser():
+    """Build the full argparse parser, used for --help and usage errors."""
+    import argparse
     parser = argparse.ArgumentParser(
         description='Validate Ansible Automation Platform release manifest',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -231,17 +433,20 @@ Examples:
   %(prog)s releases/release-v1.0.0.yaml
   %(prog)s releases/release-dev.yaml --verbose
   %(prog)s releases/release-prod.yaml --schema custom-schema.json
+  %(prog)s releases/*.yaml
         """
     )
     parser.add_argument(
-        'manifest',
+        'manifests',
         type=Path,
-        help='Path to release manifest YAML file'
+        nargs='+',
+        metavar='manifest',
+        help='Path to release manifest YAML file (several are validated in parallel)'
     )
     parser.add_argument(
         '--schema',
         type=Path,
-        default=Path(__file__).parent.parent / 'schemas' / 'release-manifest-schema.json',
+        default=DEFAULT_SCHEMA,
         help='Path to JSON schema file (default: schemas/release-manifest-schema.json)'
     )
     parser.add_argument(
@@ -249,11 +454,52 @@ Examples:
         action='store_true',
         help='Enable verbose output'
     )
+    return parser
+
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    """
+    Parse command line arguments without importing argparse.
+    
+    Handles the common invocations directly; --help and anything it does
+    not recognise are handed to build_parser() for the usual argparse
+    help text and error messages.
+    """
+    args = SimpleNamespace(manifests=[], schema=DEFAULT_SCHEMA, verbose=False)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-v', '--verbose'):
+            args.verbose = True
+        elif arg == '--schema' and i + 1 < len(argv) and not argv[i + 1].startswith('-'):
+            i += 1
+            args.schema = Path(argv[i])
+        elif arg.startswith('--schema=') and len(arg) > len('--schema='):
+            args.schema = Path(arg[len('--schema='):])
+        elif arg.startswith('-'):
+            return build_parser().parse_args(argv)
+        else:
+            args.manifests.append(Path(arg))
+        i += 1
+    
+    if not args.manifests:
+        return build_parser().parse_args(argv)
+    return args
+
+
+def main():
+    """Main entry point."""
+    args = parse_args(sys.argv[1:])
     
-    args = parser.parse_args()
+    # Block-buffer stdout even on a TTY so the report goes out in one
+    # write; it is flushed when the interpreter exits
+    sys.stdout.reconfigure(line_buffering=False)
     
-    # Validate manifest
-    success = validate_manifest_file(args.manifest, args.schema, args.verbose)
+    # Validate manifest(s)
+    if len(args.manifests) == 1:
+        success = validate_manifest_file(args.manifests[0], args.schema, args.verbose)
+    else:
+        success = validate_manifest_files(args.manifests, args.schema, args.verbose)
     
     sys.exit(0 if success else 1)
 